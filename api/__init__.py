@@ -1,3 +1,3 @@
-"""
-API app for Zillow scraper endpoints.
-"""
+"""
+API app for Zillow scraper endpoints.
+"""
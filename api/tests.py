@@ -1,169 +1,394 @@
-"""
-Tests for the Zillow scraper API.
-"""
-
-from unittest.mock import patch, MagicMock
-from django.test import TestCase
-from rest_framework.test import APITestCase
-from rest_framework import status
-
-from api.serializers import AgentSerializer, PropertySerializer, ReviewSerializer
-from core.proxy_manager import ProxyManager
-from core.user_agent_manager import UserAgentManager
-
-
-class SerializerTests(TestCase):
-    """Tests for API serializers."""
-    
-    def test_agent_serializer_valid(self):
-        """Test AgentSerializer with valid data."""
-        data = {
-            'name': 'John Doe',
-            'url': 'https://www.zillow.com/profile/johndoe',
-            'location': 'Los Angeles, CA',
-        }
-        serializer = AgentSerializer(data=data)
-        self.assertTrue(serializer.is_valid())
-    
-    def test_agent_serializer_invalid(self):
-        """Test AgentSerializer with invalid data."""
-        data = {'location': 'Los Angeles'}  # Missing required fields
-        serializer = AgentSerializer(data=data)
-        self.assertFalse(serializer.is_valid())
-    
-    def test_property_serializer_valid(self):
-        """Test PropertySerializer with valid data."""
-        data = {
-            'zpid': 123456,
-            'address': '123 Main St',
-            'url': 'https://www.zillow.com/homedetails/123_zpid',
-            'price': 500000.0,
-            'beds': 3,
-            'baths': 2,
-            'sqft': 1500,
-        }
-        serializer = PropertySerializer(data=data)
-        self.assertTrue(serializer.is_valid())
-    
-    def test_review_serializer_valid(self):
-        """Test ReviewSerializer with valid data."""
-        data = {
-            'zuid': 'user123',
-            'rating': 5,
-            'review': 'Great agent!',
-        }
-        serializer = ReviewSerializer(data=data)
-        self.assertTrue(serializer.is_valid())
-
-
-class ProxyManagerTests(TestCase):
-    """Tests for the proxy manager."""
-    
-    @patch('core.proxy_manager.settings')
-    def test_no_proxies_returns_none(self, mock_settings):
-        """Test that get_proxy returns None when no proxies configured."""
-        mock_settings.SCRAPER_SETTINGS = {'PROXIES': []}
-        manager = ProxyManager()
-        self.assertIsNone(manager.get_proxy())
-    
-    @patch('core.proxy_manager.settings')
-    @patch('core.proxy_manager.cache')
-    def test_proxy_rotation(self, mock_cache, mock_settings):
-        """Test proxy rotation."""
-        mock_settings.SCRAPER_SETTINGS = {
-            'PROXIES': ['http://proxy1:8080', 'http://proxy2:8080']
-        }
-        mock_cache.get.return_value = 0
-        
-        manager = ProxyManager()
-        proxy = manager.get_proxy()
-        
-        self.assertIsNotNone(proxy)
-        self.assertIn('http', proxy)
-        self.assertIn('https', proxy)
-
-
-class UserAgentManagerTests(TestCase):
-    """Tests for the user-agent manager."""
-    
-    def test_get_random_user_agent(self):
-        """Test that get_random_user_agent returns a string."""
-        manager = UserAgentManager()
-        ua = manager.get_random_user_agent()
-        
-        self.assertIsInstance(ua, str)
-        self.assertGreater(len(ua), 0)
-    
-    def test_get_chrome_user_agent(self):
-        """Test Chrome user agent contains Chrome."""
-        manager = UserAgentManager()
-        ua = manager.get_chrome_user_agent()
-        
-        self.assertIn('Chrome', ua)
-
-
-class APIEndpointTests(APITestCase):
-    """Integration tests for API endpoints."""
-    
-    @patch('api.views.agent_scraper')
-    def test_agent_by_location(self, mock_scraper):
-        """Test agentBylocation endpoint."""
-        mock_scraper.get_agents_by_location.return_value = [
-            {'name': 'Test Agent', 'url': 'http://test.com', 'location': 'LA'}
-        ]
-        
-        response = self.client.get('/agentBylocation', {'location': 'los-angeles'})
-        
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]['name'], 'Test Agent')
-    
-    @patch('api.views.property_scraper')
-    def test_by_location(self, mock_scraper):
-        """Test bylocation endpoint."""
-        mock_scraper.search_by_location.return_value = [
-            {
-                'zpid': 123,
-                'address': '123 Test St',
-                'url': 'http://test.com',
-                'price': 500000,
-                'beds': 3,
-                'baths': 2,
-                'sqft': 1500,
-            }
-        ]
-        
-        response = self.client.get('/bylocation', {'location': 'seattle-wa'})
-        
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-    
-    @patch('api.views.property_scraper')
-    def test_autocomplete(self, mock_scraper):
-        """Test autocomplete endpoint."""
-        mock_scraper.autocomplete.return_value = [
-            {'display': 'Los Angeles, CA', 'type': 'city', 'id': '123'}
-        ]
-        
-        response = self.client.get('/autocomplete', {'q': 'los'})
-        
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-    
-    def test_autocomplete_missing_query(self):
-        """Test autocomplete endpoint without query."""
-        response = self.client.get('/autocomplete')
-        
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-    
-    def test_by_coordinates_missing_params(self):
-        """Test bycoordinates endpoint without required params."""
-        response = self.client.get('/bycoordinates')
-        
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-    
-    def test_agent_info_missing_params(self):
-        """Test agentInfo endpoint without required params."""
-        response = self.client.get('/agentInfo')
-        
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+"""
+Tests for the Zillow scraper API.
+"""
+
+import json
+import os
+import tempfile
+from unittest.mock import patch, MagicMock
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APITestCase
+from rest_framework import status
+
+from api.serializers import AgentSerializer, PropertySerializer, ReviewSerializer
+from core.proxy_manager import ProxyManager
+from core.user_agent_manager import UserAgentManager
+from scrapers import base as scraper_base
+from scrapers.agent_scraper import AgentScraper
+from scrapers.io import start_jsonl_writer
+from scrapers import property_scraper as property_scraper_module
+from scrapers.records import PropertyCard
+from scrapers.utils import extract_next_data, parse_property_card, parse_review
+
+
+class SerializerTests(TestCase):
+    """Tests for API serializers."""
+    
+    def test_agent_serializer_valid(self):
+        """Test AgentSerializer with valid data."""
+        data = {
+            'name': 'John Doe',
+            'url': 'https://www.zillow.com/profile/johndoe',
+            'location': 'Los Angeles, CA',
+        }
+        serializer = AgentSerializer(data=data)
+        self.assertTrue(serializer.is_valid())
+    
+    def test_agent_serializer_invalid(self):
+        """Test AgentSerializer with invalid data."""
+        data = {'location': 'Los Angeles'}  # Missing required fields
+        serializer = AgentSerializer(data=data)
+        self.assertFalse(serializer.is_valid())
+    
+    def test_property_serializer_valid(self):
+        """Test PropertySerializer with valid data."""
+        data = {
+            'zpid': 123456,
+            'address': '123 Main St',
+            'url': 'https://www.zillow.com/homedetails/123_zpid',
+            'price': 500000.0,
+            'beds': 3,
+            'baths': 2,
+            'sqft': 1500,
+        }
+        serializer = PropertySerializer(data=data)
+        self.assertTrue(serializer.is_valid())
+    
+    def test_review_serializer_valid(self):
+        """Test ReviewSerializer with valid data."""
+        data = {
+            'zuid': 'user123',
+            'rating': 5,
+            'review': 'Great agent!',
+        }
+        serializer = ReviewSerializer(data=data)
+        self.assertTrue(serializer.is_valid())
+
+    
+    def test_serializers_read_parsed_records(self):
+        """Test that parsed records serialize the same way dicts do."""
+        card = parse_property_card({
+            'zpid': 123456,
+            'address': '123 Main St',
+            'detailUrl': '/homedetails/123456_zpid/',
+            'price': '$500,000',
+        })
+        data = PropertySerializer(card).data
+        self.assertEqual(data['zpid'], 123456)
+        self.assertEqual(data['url'], 'https://www.zillow.com/homedetails/123456_zpid/')
+        self.assertEqual(data['price'], 500000.0)
+        self.assertEqual(data['status'], '')
+        
+        # HTML-fallback cards leave the fields they can't scrape unset
+        data = PropertySerializer(PropertyCard(address='123 Main St')).data
+        self.assertIsNone(data['photo_url'])
+        self.assertIsNone(data['status'])
+        
+        review = parse_review({'reviewerZuid': 'user123', 'rating': 5, 'reviewText': '<b>Great</b> agent!'})
+        self.assertEqual(ReviewSerializer(review).data['review'], 'Great agent!')
+
+
+class ProxyManagerTests(TestCase):
+    """Tests for the proxy manager."""
+    
+    @patch('core.proxy_manager.settings')
+    def test_no_proxies_returns_none(self, mock_settings):
+        """Test that get_proxy returns None when no proxies configured."""
+        mock_settings.SCRAPER_SETTINGS = {'PROXIES': []}
+        manager = ProxyManager()
+        self.assertIsNone(manager.get_proxy())
+    
+    @patch('core.proxy_manager.settings')
+    @patch('core.proxy_manager.cache')
+    def test_proxy_rotation(self, mock_cache, mock_settings):
+        """Test proxy rotation."""
+        mock_settings.SCRAPER_SETTINGS = {
+            'PROXIES': ['http://proxy1:8080', 'http://proxy2:8080']
+        }
+        mock_cache.get.return_value = 0
+        
+        manager = ProxyManager()
+        proxy = manager.get_proxy()
+        
+        self.assertIsNotNone(proxy)
+        self.assertIn('http', proxy)
+        self.assertIn('https', proxy)
+
+
+class UserAgentManagerTests(TestCase):
+    """Tests for the user-agent manager."""
+    
+    def test_get_random_user_agent(self):
+        """Test that get_random_user_agent returns a string."""
+        manager = UserAgentManager()
+        ua = manager.get_random_user_agent()
+        
+        self.assertIsInstance(ua, str)
+        self.assertGreater(len(ua), 0)
+    
+    def test_get_chrome_user_agent(self):
+        """Test Chrome user agent contains Chrome."""
+        manager = UserAgentManager()
+        ua = manager.get_chrome_user_agent()
+        
+        self.assertIn('Chrome', ua)
+
+
+class NotFoundCacheTests(TestCase):
+    """Tests for the scraper's 404 negative cache."""
+    
+    def setUp(self):
+        scraper_base._NOT_FOUND_CACHE.clear()
+    
+    @patch('scrapers.base.requests.request')
+    def test_404_is_remembered(self, mock_request):
+        """Test that a 404 response marks the URL as known-not-found."""
+        mock_request.return_value = MagicMock(status_code=404)
+        url = 'https://www.zillow.com/profile/nobody/listings/sold/'
+        
+        with self.assertRaises(scraper_base.NotFoundException):
+            scraper_base.BaseScraper().get(url, use_proxy=False)
+        
+        self.assertTrue(scraper_base.is_known_not_found(url))
+        self.assertFalse(scraper_base.is_known_not_found(url, ttl=0))
+        self.assertFalse(scraper_base.is_known_not_found('https://www.zillow.com/'))
+
+
+class PageCacheTests(TestCase):
+    """Tests for the scraper's short-lived GET response cache."""
+    
+    def setUp(self):
+        scraper_base._PAGE_CACHE.clear()
+    
+    @patch('scrapers.base.requests.request')
+    def test_only_remembered_pages_are_cached(self, mock_request):
+        """Test that a GET is served from cache only once its page was remembered."""
+        mock_request.return_value = MagicMock(status_code=200)
+        scraper = scraper_base.BaseScraper()
+        url = 'https://www.zillow.com/homes/for_sale/'
+        
+        # Not yet parsed successfully (could be a block page) - fetched again
+        first = scraper.get(url, use_proxy=False)
+        scraper.get(url, use_proxy=False)
+        self.assertEqual(mock_request.call_count, 2)
+        
+        scraper.remember_page(url, first, use_proxy=False)
+        self.assertIs(scraper.get(url, use_proxy=False), first)
+        self.assertEqual(mock_request.call_count, 2)
+    
+    @patch('scrapers.base.requests.request')
+    def test_list_valued_params_skip_cache(self, mock_request):
+        """Test that list-valued params are fetched directly instead of failing to hash."""
+        mock_request.return_value = MagicMock(status_code=200)
+        scraper = scraper_base.BaseScraper()
+        url = 'https://www.zillow.com/homes/for_sale/'
+        params = {'status': ['a', 'b']}
+        
+        response = scraper.get(url, params=params, use_proxy=False)
+        scraper.remember_page(url, response, params=params, use_proxy=False)
+        scraper.get(url, params=params, use_proxy=False)
+        
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertEqual(mock_request.call_args.kwargs['params'], params)
+
+
+# Local-memory cache so clearing it can't flush the Redis DB Celery also uses
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class AutocompleteCacheTests(TestCase):
+    """Tests for autocomplete suggestion caching."""
+    
+    def setUp(self):
+        property_scraper_module._AUTOCOMPLETE_CACHE.clear()
+        cache.clear()
+    
+    @patch.object(property_scraper_module.PropertyScraper, '_fetch_autocomplete')
+    def test_shared_cache_hit_skips_fetch(self, mock_fetch):
+        """Test that suggestions stored by another process are reused."""
+        suggestions = [{'display': 'Austin, TX', 'type': 'city'}]
+        property_scraper_module._store_shared_autocomplete('austin', suggestions)
+        
+        result = property_scraper_module.PropertyScraper().autocomplete('  Austin ')
+        
+        self.assertEqual(result, suggestions)
+        mock_fetch.assert_not_called()
+    
+    @patch.object(property_scraper_module.PropertyScraper, '_autocomplete_fallback')
+    @patch.object(property_scraper_module.PropertyScraper, '_fetch_autocomplete')
+    def test_fallback_suggestion_not_cached(self, mock_fetch, mock_fallback):
+        """Test that the search-page fallback's guess isn't cached."""
+        mock_fetch.return_value = []
+        mock_fallback.return_value = [{'display': 'Austin', 'type': 'search'}]
+        scraper = property_scraper_module.PropertyScraper()
+        
+        self.assertEqual(scraper.autocomplete('austin'), mock_fallback.return_value)
+        self.assertIsNone(property_scraper_module._lookup_autocomplete('austin'))
+    
+    def test_autocomplete_many_batches_misses(self):
+        """Test that uncached queries share one aliased GraphQL request."""
+        response = MagicMock(status_code=200, content=(
+            b'{"data": {"q0": {"results": [{"display": "Seattle, WA"}]},'
+            b' "q1": {"results": [{"display": "Portland, OR"}]}}}'
+        ))
+        scraper = property_scraper_module.PropertyScraper()
+        scraper._api_session = MagicMock()
+        scraper._api_session.post.return_value = response
+        
+        result = scraper.autocomplete_many(['seattle', 'portland'])
+        
+        self.assertEqual(result['seattle'][0]['display'], 'Seattle, WA')
+        self.assertEqual(result['portland'][0]['display'], 'Portland, OR')
+        self.assertEqual(scraper._api_session.post.call_count, 1)
+    
+    def test_batch_failure_only_disables_on_rejection(self):
+        """Test that transient batch errors keep batching on, but a rejected batch doesn't."""
+        scraper = property_scraper_module.PropertyScraper()
+        scraper._api_session = MagicMock()
+        
+        scraper._api_session.post.return_value = MagicMock(status_code=503, content=b'')
+        self.assertEqual(scraper._fetch_autocomplete_batch(['seattle', 'portland']), {})
+        self.assertTrue(scraper._batch_autocomplete)
+        
+        scraper._api_session.post.return_value = MagicMock(
+            status_code=200, content=b'{"data": null, "errors": [{"message": "Unknown alias"}]}'
+        )
+        self.assertEqual(scraper._fetch_autocomplete_batch(['seattle', 'portland']), {})
+        self.assertFalse(scraper._batch_autocomplete)
+    
+    @patch.object(property_scraper_module.PropertyScraper, 'autocomplete')
+    def test_autocomplete_many_keeps_other_results_on_failure(self, mock_autocomplete):
+        """Test that one failing query doesn't lose the rest of the batch."""
+        def autocomplete(query):
+            if query == 'nowhere':
+                raise scraper_base.NotFoundException(f"No suggestions found for: {query}")
+            return [{'display': query.title()}]
+        mock_autocomplete.side_effect = autocomplete
+        scraper = property_scraper_module.PropertyScraper()
+        scraper._batch_autocomplete = False
+        
+        result = scraper.autocomplete_many(['seattle', 'nowhere'])
+        
+        self.assertEqual(result, {'seattle': [{'display': 'Seattle'}], 'nowhere': []})
+
+
+class JsonlWriterTests(TestCase):
+    """Tests for streaming scraped records to a JSONL file."""
+    
+    @patch.object(AgentScraper, 'get')
+    def test_reviews_stream_to_file(self, mock_get):
+        """Test that reviews go to the writer as they're parsed, not into results."""
+        mock_get.return_value = MagicMock(content=(
+            b'<script id="__NEXT_DATA__" type="application/json">'
+            b'{"props": {"pageProps": {"reviews": ['
+            b'{"reviewerZuid": "a", "rating": 5, "reviewText": "Great"},'
+            b'{"reviewerZuid": "b", "rating": 4, "reviewText": "Good"}'
+            b']}}}</script>'
+        ))
+        fd, path = tempfile.mkstemp(suffix='.jsonl')
+        os.close(fd)
+        self.addCleanup(os.remove, path)
+        
+        record_queue, writer = start_jsonl_writer(path)
+        result = AgentScraper().get_agent_reviews(agentname='someone', out_queue=record_queue)
+        record_queue.put(None)
+        writer.join()
+        
+        self.assertEqual(result['results'], [])
+        with open(path) as f:
+            lines = [json.loads(line) for line in f]
+        self.assertEqual([line['zuid'] for line in lines], ['a', 'b'])
+        self.assertEqual(lines[1]['review'], 'Good')
+
+
+class ExtractNextDataTests(TestCase):
+    """Tests for the byte-level __NEXT_DATA__ fast path."""
+    
+    def test_extracts_page_props(self):
+        """Test that pageProps is parsed straight from raw bytes."""
+        body = (
+            b'<html><head><script>var x = 1;</script></head><body>'
+            b'<script id="__NEXT_DATA__" type="application/json">'
+            b'{"props": {"pageProps": {"reviews": [{"rating": 5}]}}}'
+            b'</script></body></html>'
+        )
+        self.assertEqual(extract_next_data(body), {'reviews': [{'rating': 5}]})
+    
+    def test_missing_or_invalid_returns_none(self):
+        """Test that pages without valid __NEXT_DATA__ fall through to None."""
+        self.assertIsNone(extract_next_data(b'<html><body>No data</body></html>'))
+        self.assertIsNone(extract_next_data(b'<script id="__NEXT_DATA__">{not json</script>'))
+    
+    def test_gdp_property_ignores_nested_property(self):
+        """Test that only a top-level cache entry's property is returned."""
+        gdp_cache = json.dumps({
+            'q0': {'foo': {'property': {'zpid': 9}}},
+            'q1': {'property': {'zpid': 7}},
+        })
+        self.assertEqual(property_scraper_module._extract_gdp_property(gdp_cache), {'zpid': 7})
+
+
+class APIEndpointTests(APITestCase):
+    """Integration tests for API endpoints."""
+    
+    @patch('api.views.agent_scraper')
+    def test_agent_by_location(self, mock_scraper):
+        """Test agentBylocation endpoint."""
+        mock_scraper.get_agents_by_location.return_value = [
+            {'name': 'Test Agent', 'url': 'http://test.com', 'location': 'LA'}
+        ]
+        
+        response = self.client.get('/agentBylocation', {'location': 'los-angeles'})
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(response.data[0]['name'], 'Test Agent')
+    
+    @patch('api.views.property_scraper')
+    def test_by_location(self, mock_scraper):
+        """Test bylocation endpoint."""
+        mock_scraper.search_by_location.return_value = [
+            {
+                'zpid': 123,
+                'address': '123 Test St',
+                'url': 'http://test.com',
+                'price': 500000,
+                'beds': 3,
+                'baths': 2,
+                'sqft': 1500,
+            }
+        ]
+        
+        response = self.client.get('/bylocation', {'location': 'seattle-wa'})
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 1)
+    
+    @patch('api.views.property_scraper')
+    def test_autocomplete(self, mock_scraper):
+        """Test autocomplete endpoint."""
+        mock_scraper.autocomplete.return_value = [
+            {'display': 'Los Angeles, CA', 'type': 'city', 'id': '123'}
+        ]
+        
+        response = self.client.get('/autocomplete', {'q': 'los'})
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 1)
+    
+    def test_autocomplete_missing_query(self):
+        """Test autocomplete endpoint without query."""
+        response = self.client.get('/autocomplete')
+        
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+    
+    def test_by_coordinates_missing_params(self):
+        """Test bycoordinates endpoint without required params."""
+        response = self.client.get('/bycoordinates')
+        
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+    
+    def test_agent_info_missing_params(self):
+        """Test agentInfo endpoint without required params."""
+        response = self.client.get('/agentInfo')
+        
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
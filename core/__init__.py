@@ -1,3 +1,3 @@
-"""
-Core module for infrastructure utilities.
-"""
+"""
+Core module for infrastructure utilities.
+"""
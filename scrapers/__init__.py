@@ -1,3 +1,3 @@
-"""
-Scrapers module for Zillow data extraction.
-"""
+"""
+Scrapers module for Zillow data extraction.
+"""
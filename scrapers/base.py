@@ -1,208 +1,397 @@
-"""
-Base scraper class with common functionality.
-"""
-
-import time
-import random
-import logging
-from typing import Optional, Dict, Any
-from urllib.parse import urljoin
-
-import requests
-from bs4 import BeautifulSoup
-from django.conf import settings
-
-from core.proxy_manager import proxy_manager
-from core.user_agent_manager import user_agent_manager
-
-logger = logging.getLogger(__name__)
-
-
-class ScraperException(Exception):
-    """Base exception for scraper errors."""
-    pass
-
-
-class BlockedException(ScraperException):
-    """Raised when the scraper is blocked by the target site."""
-    pass
-
-
-class NotFoundException(ScraperException):
-    """Raised when the requested resource is not found."""
-    pass
-
-
-class BaseScraper:
-    """
-    Base scraper class with proxy rotation, user-agent rotation,
-    request delays, and retry logic.
-    """
-    
-    BASE_URL = "https://www.zillow.com"
-    
-    def __init__(self):
-        # Don't use a persistent session - create fresh connections
-        # This allows rotating proxies to give new IPs per request
-        self.use_session = False
-        
-        scraper_settings = getattr(settings, 'SCRAPER_SETTINGS', {})
-        self.delay_min = scraper_settings.get('REQUEST_DELAY_MIN', 1.0)
-        self.delay_max = scraper_settings.get('REQUEST_DELAY_MAX', 3.0)
-        self.timeout = scraper_settings.get('REQUEST_TIMEOUT', 30)
-        self.max_retries = scraper_settings.get('MAX_RETRIES', 3)
-    
-    def _get_headers(self) -> Dict[str, str]:
-        """Get headers with a random user agent."""
-        return {
-            'User-Agent': user_agent_manager.get_random_user_agent(),
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'close',  # Don't keep connection alive for rotating proxy
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none',
-            'Sec-Fetch-User': '?1',
-            'Cache-Control': 'max-age=0',
-        }
-    
-    def _delay(self):
-        """Introduce a random delay between requests."""
-        delay = random.uniform(self.delay_min, self.delay_max)
-        logger.debug(f"Waiting {delay:.2f} seconds before request")
-        time.sleep(delay)
-    
-    def _make_request(
-        self,
-        url: str,
-        method: str = 'GET',
-        params: Optional[Dict] = None,
-        data: Optional[Dict] = None,
-        json_data: Optional[Dict] = None,
-        use_proxy: bool = True,
-        retry_count: int = 0,
-    ) -> requests.Response:
-        """
-        Make an HTTP request with retry logic.
-        
-        Args:
-            url: Target URL
-            method: HTTP method (GET, POST, etc.)
-            params: Query parameters
-            data: Form data
-            json_data: JSON payload
-            use_proxy: Whether to use proxy rotation
-            retry_count: Current retry attempt
-            
-        Returns:
-            Response object
-            
-        Raises:
-            ScraperException: If request fails after all retries
-        """
-        if retry_count > 0:
-            self._delay()
-        
-        headers = self._get_headers()
-        proxies = proxy_manager.get_proxy() if use_proxy else None
-        
-        try:
-            # Use requests directly (not session) for fresh connections
-            # This allows rotating proxy to provide new IP per request
-            response = requests.request(
-                method=method,
-                url=url,
-                params=params,
-                data=data,
-                json=json_data,
-                headers=headers,
-                proxies=proxies,
-                timeout=self.timeout,
-            )
-            
-            # Check for blocking
-            if response.status_code == 403:
-                raise BlockedException("Request blocked by Zillow (403 Forbidden)")
-            
-            if response.status_code == 429:
-                raise BlockedException("Rate limited by Zillow (429 Too Many Requests)")
-            
-            if response.status_code == 404:
-                raise NotFoundException(f"Resource not found: {url}")
-            
-            response.raise_for_status()
-            
-            # Mark proxy as successful
-            if proxies:
-                proxy_manager.mark_proxy_success(proxies.get('http', ''))
-            
-            return response
-            
-        except (requests.exceptions.RequestException, BlockedException) as e:
-            # Mark proxy as failed
-            if proxies:
-                proxy_manager.mark_proxy_failed(proxies.get('http', ''))
-            
-            if retry_count < self.max_retries:
-                logger.warning(
-                    f"Request failed (attempt {retry_count + 1}/{self.max_retries}): {e}"
-                )
-                return self._make_request(
-                    url=url,
-                    method=method,
-                    params=params,
-                    data=data,
-                    json_data=json_data,
-                    use_proxy=use_proxy,
-                    retry_count=retry_count + 1,
-                )
-            
-            logger.error(f"Request failed after {self.max_retries} retries: {e}")
-            raise ScraperException(f"Failed to fetch {url}: {e}")
-    
-    def get(
-        self,
-        url: str,
-        params: Optional[Dict] = None,
-        use_proxy: bool = True,
-    ) -> requests.Response:
-        """Make a GET request."""
-        return self._make_request(url, 'GET', params=params, use_proxy=use_proxy)
-    
-    def post(
-        self,
-        url: str,
-        data: Optional[Dict] = None,
-        json_data: Optional[Dict] = None,
-        use_proxy: bool = True,
-    ) -> requests.Response:
-        """Make a POST request."""
-        return self._make_request(
-            url, 'POST', data=data, json_data=json_data, use_proxy=use_proxy
-        )
-    
-    def get_soup(
-        self,
-        url: str,
-        params: Optional[Dict] = None,
-        use_proxy: bool = True,
-    ) -> BeautifulSoup:
-        """
-        Fetch a page and return a BeautifulSoup object.
-        
-        Args:
-            url: Target URL
-            params: Query parameters
-            use_proxy: Whether to use proxy rotation
-            
-        Returns:
-            BeautifulSoup object
-        """
-        response = self.get(url, params=params, use_proxy=use_proxy)
-        return BeautifulSoup(response.text, 'lxml')
-    
-    def build_url(self, path: str) -> str:
-        """Build a full URL from a relative path."""
-        return urljoin(self.BASE_URL, path)
+"""
+Base scraper class with common functionality.
+"""
+
+import time
+import random
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Optional, Dict, Any, Callable, Hashable, Tuple
+from urllib.parse import urljoin
+
+import requests
+from bs4 import BeautifulSoup
+from django.conf import settings
+
+from core.proxy_manager import proxy_manager
+from core.user_agent_manager import user_agent_manager
+
+from .utils import dumps_json_bytes
+
+logger = logging.getLogger(__name__)
+
+class TTLCache:
+    """
+    Small thread-safe cache whose entries expire `ttl` seconds after being stored.
+    
+    When full, expired entries are pruned first; if it's still full of live
+    entries, the oldest one is dropped.
+    """
+    
+    def __init__(self, ttl: float, max_size: int):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable, ttl: Optional[float] = None) -> Any:
+        """
+        Return the value stored for a key, or None if missing or expired.
+        
+        Args:
+            key: Cache key
+            ttl: Stricter max age for this lookup (defaults to the cache's ttl)
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        age = time.time() - stored_at
+        if age >= self.ttl:
+            with self._lock:
+                # Only drop it if it wasn't refreshed in the meantime
+                if self._entries.get(key) is entry:
+                    del self._entries[key]
+            return None
+        if ttl is not None and age >= ttl:
+            return None
+        return value
+    
+    def set(self, key: Hashable, value: Any):
+        """Store a value, making room first if the cache is full."""
+        now = time.time()
+        with self._lock:
+            if len(self._entries) >= self.max_size:
+                for cached_key, (stored_at, _) in list(self._entries.items()):
+                    if now - stored_at >= self.ttl:
+                        del self._entries[cached_key]
+                if len(self._entries) >= self.max_size:
+                    del self._entries[next(iter(self._entries))]
+            # Re-insert so iteration order stays oldest-first
+            self._entries.pop(key, None)
+            self._entries[key] = (now, value)
+    
+    def pop(self, key: Hashable):
+        """Drop a key if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+    
+    def clear(self):
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# URLs that recently returned 404. Lets callers skip straight to a
+# fallback instead of paying the round-trip again.
+NOT_FOUND_TTL = 3600
+NOT_FOUND_CACHE_MAX_SIZE = 1024
+_NOT_FOUND_CACHE = TTLCache(NOT_FOUND_TTL, NOT_FOUND_CACHE_MAX_SIZE)
+
+
+def is_known_not_found(url: str, ttl: float = NOT_FOUND_TTL) -> bool:
+    """Check whether a URL returned 404 within the last `ttl` seconds."""
+    return _NOT_FOUND_CACHE.get(url, ttl=ttl) is not None
+
+
+# Recently fetched GET responses, keyed like in-flight requests. Covers
+# retries and list-then-detail flows that re-request the same page within
+# a minute. Kept small - each entry holds a whole page body.
+PAGE_CACHE_TTL = 60
+PAGE_CACHE_MAX_SIZE = 32
+_PAGE_CACHE = TTLCache(PAGE_CACHE_TTL, PAGE_CACHE_MAX_SIZE)
+
+
+class ScraperException(Exception):
+    """Base exception for scraper errors."""
+    pass
+
+
+class BlockedException(ScraperException):
+    """Raised when the scraper is blocked by the target site."""
+    pass
+
+
+class NotFoundException(ScraperException):
+    """Raised when the requested resource is not found."""
+    pass
+
+
+class BaseScraper:
+    """
+    Base scraper class with proxy rotation, user-agent rotation,
+    request delays, and retry logic.
+    """
+    
+    BASE_URL = "https://www.zillow.com"
+    
+    # lxml builds trees several times faster than the stdlib html.parser
+    HTML_PARSER = 'lxml'
+    
+    # Request headers other than the User-Agent, which rotates per request
+    DEFAULT_HEADERS = {
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.5',
+        'Accept-Encoding': 'gzip, deflate, br',
+        'Connection': 'close',  # Don't keep connection alive for rotating proxy
+        'Upgrade-Insecure-Requests': '1',
+        'Sec-Fetch-Dest': 'document',
+        'Sec-Fetch-Mode': 'navigate',
+        'Sec-Fetch-Site': 'none',
+        'Sec-Fetch-User': '?1',
+        'Cache-Control': 'max-age=0',
+    }
+    
+    def __init__(self):
+        # Don't use a persistent session - create fresh connections
+        # This allows rotating proxies to give new IPs per request
+        self.use_session = False
+        
+        scraper_settings = getattr(settings, 'SCRAPER_SETTINGS', {})
+        self.delay_min = scraper_settings.get('REQUEST_DELAY_MIN', 1.0)
+        self.delay_max = scraper_settings.get('REQUEST_DELAY_MAX', 3.0)
+        self.timeout = scraper_settings.get('REQUEST_TIMEOUT', 30)
+        self.max_retries = scraper_settings.get('MAX_RETRIES', 3)
+        
+        # In-flight GET requests, so concurrent callers asking for the same
+        # page share one request instead of each using a proxy slot
+        self._inflight: Dict[Hashable, Future] = {}
+        self._inflight_lock = threading.Lock()
+    
+    def _get_headers(self, static_headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        """
+        Get headers with a random user agent.
+        
+        Args:
+            static_headers: Prebuilt headers to send instead of DEFAULT_HEADERS
+        """
+        return {
+            'User-Agent': user_agent_manager.get_random_user_agent(),
+            **(static_headers or self.DEFAULT_HEADERS),
+        }
+    
+    def _delay(self):
+        """Introduce a random delay between requests."""
+        delay = random.uniform(self.delay_min, self.delay_max)
+        logger.debug(f"Waiting {delay:.2f} seconds before request")
+        time.sleep(delay)
+    
+    def _make_request(
+        self,
+        url: str,
+        method: str = 'GET',
+        params: Optional[Dict] = None,
+        data: Optional[Dict] = None,
+        json_data: Optional[Dict] = None,
+        use_proxy: bool = True,
+        retry_count: int = 0,
+    ) -> requests.Response:
+        """
+        Make an HTTP request with retry logic.
+        
+        Args:
+            url: Target URL
+            method: HTTP method (GET, POST, etc.)
+            params: Query parameters
+            data: Form data
+            json_data: JSON payload
+            use_proxy: Whether to use proxy rotation
+            retry_count: Current retry attempt
+            
+        Returns:
+            Response object
+            
+        Raises:
+            ScraperException: If request fails after all retries
+        """
+        if retry_count > 0:
+            self._delay()
+        
+        headers = self._get_headers()
+        proxies = proxy_manager.get_proxy() if use_proxy else None
+        
+        # Serialize JSON payloads ourselves (orjson is much faster than stdlib json)
+        body = data
+        if json_data is not None:
+            try:
+                body = dumps_json_bytes(json_data)
+            except TypeError as e:
+                raise ScraperException(f"Failed to serialize JSON payload for {url}: {e}")
+            headers['Content-Type'] = 'application/json'
+        
+        try:
+            # Use requests directly (not session) for fresh connections
+            # This allows rotating proxy to provide new IP per request
+            response = requests.request(
+                method=method,
+                url=url,
+                params=params,
+                data=body,
+                headers=headers,
+                proxies=proxies,
+                timeout=self.timeout,
+            )
+            
+            # Check for blocking
+            if response.status_code == 403:
+                raise BlockedException("Request blocked by Zillow (403 Forbidden)")
+            
+            if response.status_code == 429:
+                raise BlockedException("Rate limited by Zillow (429 Too Many Requests)")
+            
+            if response.status_code == 404:
+                _NOT_FOUND_CACHE.set(url, True)
+                raise NotFoundException(f"Resource not found: {url}")
+            
+            response.raise_for_status()
+            
+            # Mark proxy as successful
+            if proxies:
+                proxy_manager.mark_proxy_success(proxies.get('http', ''))
+            
+            return response
+            
+        except (requests.exceptions.RequestException, BlockedException) as e:
+            # Mark proxy as failed
+            if proxies:
+                proxy_manager.mark_proxy_failed(proxies.get('http', ''))
+            
+            if retry_count < self.max_retries:
+                logger.warning(
+                    f"Request failed (attempt {retry_count + 1}/{self.max_retries}): {e}"
+                )
+                return self._make_request(
+                    url=url,
+                    method=method,
+                    params=params,
+                    data=data,
+                    json_data=json_data,
+                    use_proxy=use_proxy,
+                    retry_count=retry_count + 1,
+                )
+            
+            logger.error(f"Request failed after {self.max_retries} retries: {e}")
+            raise ScraperException(f"Failed to fetch {url}: {e}")
+    
+    def _dedupe_request(self, key: Hashable, fetch: Callable[[], requests.Response]) -> requests.Response:
+        """
+        Run `fetch` once per key among concurrent callers.
+        
+        The first caller performs the request; callers arriving while it is
+        still in flight wait for and share its result (or exception).
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._inflight[key] = future
+        
+        if not is_owner:
+            logger.debug(f"Waiting on identical in-flight request: {key[1]}")
+            return future.result()
+        
+        try:
+            response = fetch()
+            future.set_result(response)
+            return response
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+    
+    def get(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        use_proxy: bool = True,
+    ) -> requests.Response:
+        """
+        Make a GET request, answered from the page cache when possible.
+        
+        Responses aren't cached here - Zillow serves captcha and "Access
+        denied" pages with a 200 - so callers call remember_page() once a
+        response has parsed successfully.
+        """
+        try:
+            key = self._get_request_key(url, params, use_proxy)
+        except TypeError:  # Unhashable param value (e.g. a list) - fetch without dedupe or caching
+            return self._make_request(url, 'GET', params=params, use_proxy=use_proxy)
+        response = _PAGE_CACHE.get(key)
+        if response is not None:
+            logger.debug(f"Using cached response: {url}")
+            return response
+        return self._dedupe_request(
+            key,
+            lambda: self._make_request(url, 'GET', params=params, use_proxy=use_proxy),
+        )
+    
+    def remember_page(
+        self,
+        url: str,
+        response: requests.Response,
+        params: Optional[Dict] = None,
+        use_proxy: bool = True,
+    ):
+        """Cache a GET response that parsed successfully, for PAGE_CACHE_TTL seconds."""
+        try:
+            key = self._get_request_key(url, params, use_proxy)
+        except TypeError:  # Unhashable param value - not cacheable
+            return
+        _PAGE_CACHE.set(key, response)
+    
+    @staticmethod
+    def _get_request_key(url: str, params: Optional[Dict], use_proxy: bool) -> Hashable:
+        """Key identifying a GET request, for in-flight dedupe and the page cache."""
+        return ('GET', url, frozenset((params or {}).items()), use_proxy)
+    
+    def post(
+        self,
+        url: str,
+        data: Optional[Dict] = None,
+        json_data: Optional[Dict] = None,
+        use_proxy: bool = True,
+    ) -> requests.Response:
+        """Make a POST request."""
+        return self._make_request(
+            url, 'POST', data=data, json_data=json_data, use_proxy=use_proxy
+        )
+    
+    def get_soup(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        use_proxy: bool = True,
+    ) -> BeautifulSoup:
+        """
+        Fetch a page and return a BeautifulSoup object.
+        
+        Args:
+            url: Target URL
+            params: Query parameters
+            use_proxy: Whether to use proxy rotation
+            
+        Returns:
+            BeautifulSoup object
+        """
+        response = self.get(url, params=params, use_proxy=use_proxy)
+        return self.soup_from_response(response)
+    
+    def soup_from_response(self, response: requests.Response) -> BeautifulSoup:
+        """Parse an already-fetched response into a BeautifulSoup object."""
+        # Hand lxml the raw bytes and let it decode them, rather than first
+        # building a decoded copy of the whole page via response.text
+        return BeautifulSoup(response.content, self.HTML_PARSER, from_encoding=response.encoding)
+    
+    def build_url(self, path: str) -> str:
+        """Build a full URL from a relative path (absolute URLs pass through)."""
+        # Site-relative paths are by far the common case - skip urljoin's parsing
+        if path[:1] == '/' and path[1:2] != '/':
+            return self.BASE_URL + path
+        return urljoin(self.BASE_URL, path)
@@ -0,0 +1,83 @@
+"""
+Output helpers for persisting scraped records.
+"""
+
+import queue
+import logging
+import threading
+from typing import Any, List, Optional, Tuple
+
+from .records import to_dict
+from .utils import dumps_json_bytes
+
+logger = logging.getLogger(__name__)
+
+
+def _dumps_line(record: Any) -> bytes:
+    """Serialize one record as a JSONL line."""
+    return dumps_json_bytes(to_dict(record)) + b'\n'
+
+
+class RecordCollector:
+    """
+    Collect parsed records into a list, or stream them to a queue as they're parsed.
+
+    With a queue, records go straight out (as dicts) and `records` stays
+    empty, so scrapers never hold the full result set in memory.
+    """
+
+    def __init__(self, out_queue: Optional[queue.Queue] = None):
+        self.out_queue = out_queue
+        self.records: List[Any] = []
+        self.count = 0
+
+    def add(self, record: Any):
+        """Collect or stream one parsed record."""
+        self.count += 1
+        if self.out_queue is None:
+            self.records.append(record)
+        else:
+            self.out_queue.put(to_dict(record))
+
+
+def jsonl_writer(path: str, record_queue: queue.Queue) -> int:
+    """
+    Append records from a queue to a JSONL file until a None sentinel arrives.
+
+    Intended to be the single writer for a file: producers put parsed
+    records on the queue, so appends never interleave even on network
+    filesystems where concurrent appends aren't atomic.
+
+    Args:
+        path: Output file path (opened in append mode)
+        record_queue: Queue of records (dicts or parsed records); None stops the writer
+
+    Returns:
+        Number of records written
+    """
+    written = 0
+    with open(path, 'ab') as f:
+        while (record := record_queue.get()) is not None:
+            f.write(_dumps_line(record))
+            written += 1
+    logger.info(f"Wrote {written} records to {path}")
+    return written
+
+
+def start_jsonl_writer(path: str, maxsize: int = 1000) -> Tuple[queue.Queue, threading.Thread]:
+    """
+    Start a background jsonl_writer thread.
+
+    Args:
+        path: Output file path
+        maxsize: Queue bound, so fast producers block instead of buffering unboundedly
+
+    Returns:
+        (queue, thread) - put records on the queue, then put None and join the thread
+    """
+    record_queue = queue.Queue(maxsize=maxsize)
+    thread = threading.Thread(
+        target=jsonl_writer, args=(path, record_queue), name='jsonl-writer', daemon=True
+    )
+    thread.start()
+    return record_queue, thread
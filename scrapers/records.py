@@ -0,0 +1,54 @@
+"""
+Record types for parsed Zillow data.
+
+Parsed reviews and property cards are produced in bulk, so they use
+NamedTuple / slotted dataclasses instead of per-record dicts. The API
+serializers read them by attribute; use `to_dict` where a plain dict is
+needed (e.g. JSON task results).
+"""
+
+from dataclasses import dataclass, asdict, is_dataclass
+from typing import Any, Dict, NamedTuple, Optional
+
+
+class Review(NamedTuple):
+    """A parsed agent review."""
+
+    zuid: str = ''
+    rating: Any = 0
+    review: str = ''
+    reviewer_name: str = ''
+    date: str = ''
+    transaction_type: str = ''
+
+
+@dataclass(slots=True)
+class PropertyCard:
+    """
+    A parsed property listing card.
+
+    Fields the HTML fallbacks can't fill default to None rather than ''.
+    """
+
+    zpid: Optional[int] = None
+    address: str = ''
+    url: Optional[str] = ''
+    photo_url: Optional[str] = None
+    price: Optional[float] = None
+    beds: Optional[Any] = None
+    baths: Optional[Any] = None
+    sqft: Optional[Any] = None
+    property_type: Optional[str] = None
+    status: Optional[str] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    brokerage: Optional[str] = None
+
+
+def to_dict(record: Any) -> Dict:
+    """Convert a parsed record (or an already-plain dict) to a dict."""
+    if isinstance(record, dict):
+        return record
+    if is_dataclass(record):
+        return asdict(record)
+    return record._asdict()
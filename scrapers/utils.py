@@ -1,329 +1,549 @@
-"""
-Utility functions for parsing Zillow pages.
-"""
-
-import re
-import json
-import logging
-from typing import Optional, Dict, Any, List
-from bs4 import BeautifulSoup
-
-logger = logging.getLogger(__name__)
-
-
-def extract_json_from_script(soup: BeautifulSoup, pattern: str = None) -> Optional[Dict]:
-    """
-    Extract JSON data from script tags in Zillow pages.
-    
-    Zillow often embeds JSON data in script tags with specific IDs or patterns.
-    
-    Args:
-        soup: BeautifulSoup object
-        pattern: Optional regex pattern to match script content
-        
-    Returns:
-        Parsed JSON data or None
-    """
-    # Try to find __NEXT_DATA__ script (common in Next.js pages)
-    next_data = soup.find('script', {'id': '__NEXT_DATA__'})
-    if next_data:
-        try:
-            data = json.loads(next_data.string)
-            return data.get('props', {}).get('pageProps', {})
-        except (json.JSONDecodeError, AttributeError) as e:
-            logger.warning(f"Failed to parse __NEXT_DATA__: {e}")
-    
-    # Try to find application/json script
-    json_scripts = soup.find_all('script', {'type': 'application/json'})
-    for script in json_scripts:
-        try:
-            if script.string:
-                return json.loads(script.string)
-        except json.JSONDecodeError:
-            continue
-    
-    # Try to find embedded JS data
-    if pattern:
-        for script in soup.find_all('script'):
-            if script.string and re.search(pattern, script.string):
-                match = re.search(r'({.+})', script.string, re.DOTALL)
-                if match:
-                    try:
-                        return json.loads(match.group(1))
-                    except json.JSONDecodeError:
-                        continue
-    
-    return None
-
-
-def extract_apollo_state(soup: BeautifulSoup) -> Optional[Dict]:
-    """
-    Extract Apollo state data from Zillow pages.
-    
-    Zillow uses Apollo GraphQL client and stores state in the page.
-    """
-    for script in soup.find_all('script'):
-        if script.string and 'apolloState' in script.string:
-            try:
-                match = re.search(r'"apolloState"\s*:\s*({.+?})\s*,\s*"[a-zA-Z]', script.string)
-                if match:
-                    return json.loads(match.group(1))
-            except (json.JSONDecodeError, AttributeError):
-                continue
-    return None
-
-
-def clean_price(price_str: str) -> Optional[float]:
-    """
-    Clean and parse a price string.
-    
-    Args:
-        price_str: Price string like "$1,234,567" or "1234567"
-        
-    Returns:
-        Float value or None if parsing fails
-    """
-    if not price_str:
-        return None
-    
-    try:
-        # Remove currency symbols, commas, and whitespace
-        cleaned = re.sub(r'[^\d.]', '', str(price_str))
-        return float(cleaned) if cleaned else None
-    except (ValueError, TypeError):
-        return None
-
-
-def clean_number(num_str: str) -> Optional[int]:
-    """
-    Clean and parse a number string.
-    
-    Args:
-        num_str: Number string like "3 beds" or "2,500 sqft"
-        
-    Returns:
-        Integer value or None if parsing fails
-    """
-    if not num_str:
-        return None
-    
-    try:
-        # Extract first number from string
-        match = re.search(r'[\d,]+', str(num_str))
-        if match:
-            cleaned = match.group().replace(',', '')
-            return int(cleaned)
-        return None
-    except (ValueError, TypeError):
-        return None
-
-
-def clean_text(text: str) -> str:
-    """Clean whitespace and normalize text, stripping HTML tags."""
-    if not text:
-        return ""
-    # Strip HTML tags
-    text = BeautifulSoup(str(text), "html.parser").get_text()
-    return ' '.join(text.split())
-
-
-def extract_zpid_from_url(url: str) -> Optional[int]:
-    """
-    Extract Zillow Property ID (zpid) from a URL.
-    
-    Args:
-        url: Zillow property URL
-        
-    Returns:
-        ZPID as integer or None
-    """
-    if not url:
-        return None
-    
-    # Pattern: /homedetails/ADDRESS/ZPID_zpid/
-    match = re.search(r'/(\d+)_zpid', url)
-    if match:
-        return int(match.group(1))
-    
-    # Pattern: zpid=ZPID
-    match = re.search(r'zpid=(\d+)', url)
-    if match:
-        return int(match.group(1))
-    
-    return None
-
-
-def parse_property_card(card_data: Dict) -> Optional[Dict]:
-    """
-    Parse property data from a Zillow listing card.
-    
-    Args:
-        card_data: Dictionary containing property card data
-        
-    Returns:
-        Normalized property dictionary
-    """
-    try:
-        # Handle address - can be dict, string, or composed from street + city
-        address = card_data.get('address') or card_data.get('streetAddress', '')
-        if isinstance(address, dict):
-            # Format address from dict (forSaleListings format)
-            line1 = address.get('line1', '')
-            line2 = address.get('line2', '')
-            address = f"{line1}, {line2}" if line1 and line2 else line1 or line2
-        elif not address:
-            # pastSales format: street_address + city_state_zipcode
-            street = card_data.get('street_address', '')
-            city_state = card_data.get('city_state_zipcode', '')
-            address = f"{street}, {city_state}" if street and city_state else street or city_state
-        
-        # Handle URL - may be relative or full, check multiple field names
-        url = card_data.get('detailUrl') or card_data.get('listing_url') or card_data.get('home_details_url', '')
-        if url and not url.startswith('http'):
-            url = f"https://www.zillow.com{url}"
-        
-        # Handle photo URL - multiple possible field names
-        photo_url = (card_data.get('primary_photo_url') or 
-                    card_data.get('imgSrc') or 
-                    card_data.get('image_url') or 
-                    card_data.get('medium_image_url', ''))
-        
-        # Handle sqft - multiple possible field names
-        sqft = (card_data.get('area') or 
-               card_data.get('livingArea') or 
-               card_data.get('livingAreaValue'))
-        
-        # Handle status - for sold properties, use sold_date
-        status = (card_data.get('statusType') or 
-                 card_data.get('status') or 
-                 card_data.get('home_marketing_status') or
-                 card_data.get('sold_date', ''))
-        
-        # Handle brokerage - multiple possible field names and nested structures
-        brokerage = (card_data.get('brokerage_name') or
-                    card_data.get('brokerName') or
-                    card_data.get('brokerageName') or
-                    card_data.get('listingProvider') or
-                    '')
-        
-        # Check nested attributionInfo
-        if not brokerage:
-            attribution = card_data.get('attributionInfo', {})
-            if isinstance(attribution, dict):
-                brokerage = (attribution.get('brokerName') or 
-                            attribution.get('agentName') or
-                            attribution.get('listingOffice', ''))
-        
-        return {
-            'zpid': card_data.get('zpid') or extract_zpid_from_url(url),
-            'address': address,
-            'url': url,
-            'photo_url': photo_url,
-            'price': clean_price(card_data.get('price') or card_data.get('unformattedPrice')),
-            'beds': card_data.get('beds') or card_data.get('bedrooms'),
-            'baths': card_data.get('baths') or card_data.get('bathrooms'),
-            'sqft': sqft,
-            'property_type': card_data.get('propertyType') or card_data.get('home_type', ''),
-            'status': status,
-            'latitude': card_data.get('latitude'),
-            'longitude': card_data.get('longitude'),
-            'brokerage': brokerage,
-        }
-    except Exception as e:
-        logger.warning(f"Failed to parse property card: {e}")
-        return None
-
-
-def parse_agent_card(card_data: Dict) -> Optional[Dict]:
-    """
-    Parse agent data from a Zillow agent card.
-    
-    Args:
-        card_data: Dictionary containing agent card data
-        
-    Returns:
-        Normalized agent dictionary
-    """
-    try:
-        name = card_data.get('fullName') or card_data.get('name', '')
-        screenname = card_data.get('screenName', '')
-        
-        return {
-            'name': name,
-            'url': f"https://www.zillow.com/profile/{screenname}" if screenname else '',
-            'location': card_data.get('location', ''),
-            'phone': card_data.get('phone', ''),
-            'rating': card_data.get('avgRating'),
-            'reviews_count': card_data.get('numReviews'),
-            'sales_count': card_data.get('salesLast12Months'),
-            'photo_url': card_data.get('profilePhotoSrc', ''),
-        }
-    except Exception as e:
-        logger.warning(f"Failed to parse agent card: {e}")
-        return None
-
-
-def parse_review(review_data: Dict) -> Optional[Dict]:
-    """
-    Parse review data from Zillow.
-    
-    Args:
-        review_data: Dictionary containing review data
-        
-    Returns:
-        Normalized review dictionary
-    """
-    try:
-        # Extract reviewer info which might be nested
-        reviewer = review_data.get('reviewer', {})
-        reviewer_name = review_data.get('reviewerName') or review_data.get('subHeader') or reviewer.get('screenName', '')
-        reviewer_zuid = review_data.get('reviewerZuid') or reviewer.get('encodedZuid', '')
-        
-        return {
-            'zuid': reviewer_zuid,
-            'rating': review_data.get('rating') or review_data.get('overallRating', 0),
-            'review': clean_text(review_data.get('reviewText') or review_data.get('reviewComment', '')),
-            'reviewer_name': reviewer_name,
-            'date': review_data.get('createDate') or review_data.get('date', ''),
-            'transaction_type': review_data.get('transactionType') or review_data.get('workType') or review_data.get('workDescription', ''),
-        }
-    except Exception as e:
-        logger.warning(f"Failed to parse review: {e}")
-        return None
-
-
-def build_search_url(
-    location: str = None,
-    list_type: str = 'for-sale',
-    page: int = 1,
-    **filters
-) -> str:
-    """
-    Build a Zillow search URL with filters.
-    
-    Args:
-        location: Location string (e.g., "seattle-wa")
-        list_type: Type of listing (for-sale, for-rent, sold)
-        page: Page number
-        **filters: Additional filters
-        
-    Returns:
-        Formatted search URL
-    """
-    base = "https://www.zillow.com"
-    
-    if location:
-        path = f"/{location}/"
-    else:
-        path = "/homes/"
-    
-    if list_type == 'for-rent':
-        path += "rentals/"
-    elif list_type == 'sold':
-        path += "sold/"
-    
-    # Add pagination
-    if page > 1:
-        path += f"{page}_p/"
-    
-    return base + path
+"""
+Utility functions for parsing Zillow pages.
+"""
+
+import re
+import html
+import json
+import logging
+import functools
+from typing import Optional, Dict, Any, List, Iterator, Tuple
+from bs4 import BeautifulSoup, NavigableString
+
+from .records import PropertyCard, Review
+
+try:
+    import orjson
+except ImportError:  # Optional speedup - fall back to stdlib json
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+_SCRIPT_RE = re.compile(rb'<script\b[^>]*>(.*?)</script>', re.S | re.I)
+_TITLE_RE = re.compile(rb'<title\b[^>]*>(.*?)</title>', re.S | re.I)
+
+# Cleaners and extractors run per card / per script - compile their patterns once
+_EMBEDDED_OBJECT_RE = re.compile(r'({.+})', re.DOTALL)
+_APOLLO_STATE_BYTES_RE = re.compile(rb'"apolloState"\s*:\s*({.+?})\s*,\s*"[a-zA-Z]')
+_NON_PRICE_RE = re.compile(r'[^\d.]')
+_NUMBER_RE = re.compile(r'[\d,]+')
+_ZPID_PATH_RE = re.compile(r'/(\d+)_zpid')
+_ZPID_QUERY_RE = re.compile(r'zpid=(\d+)')
+# A tag starts with a name, '/' or '!' - a bare '<' (e.g. "5 < 6") is text
+_TAG_RE = re.compile(r'<[A-Za-z/!][^<>]*>')
+_JSON_DECODER = json.JSONDecoder()
+
+
+def loads_json(data):
+    """
+    Parse a JSON document from str or bytes.
+    
+    Uses orjson when installed. orjson.JSONDecodeError subclasses
+    json.JSONDecodeError, so callers can keep catching the stdlib error.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def loads_embedded_json(text: bytes):
+    """
+    Parse a JSON object that may be embedded in a JS statement.
+    
+    Pure-JSON scripts are parsed whole. For scripts like
+    `window.__STATE__ = {...};` the object starting at the first `{` is
+    decoded with raw_decode, which stops at its matching closing brace
+    instead of failing on the surrounding JavaScript.
+    
+    Raises:
+        ValueError: If no JSON object can be decoded
+    """
+    start = text.find(b'{')
+    if start < 0:
+        raise ValueError("No JSON object found")
+    if not text[:start].strip():
+        return loads_json(text)
+    obj, _ = _JSON_DECODER.raw_decode(text[start:].decode('utf-8'))
+    return obj
+
+
+def dumps_json_bytes(obj) -> bytes:
+    """
+    Serialize an object to compact UTF-8 JSON bytes, using orjson when installed.
+    
+    Non-str dict keys are coerced to strings, as the stdlib json module does.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def dumps_json(obj) -> str:
+    """Serialize an object to a compact JSON string, using orjson when installed."""
+    return dumps_json_bytes(obj).decode('utf-8')
+
+
+def fast_extract_next_data(body: bytes) -> Optional[bytes]:
+    """
+    Locate the raw __NEXT_DATA__ JSON in a page body without parsing the HTML.
+    
+    Args:
+        body: Raw response bytes
+        
+    Returns:
+        The script tag's JSON bytes, or None if the tag isn't present
+    """
+    i = body.find(b'id="__NEXT_DATA__"')
+    if i < 0:
+        return None
+    start = body.find(b'>', i) + 1
+    end = body.find(b'</script>', start)
+    if start <= 0 or end < 0:
+        return None
+    return body[start:end]
+
+
+def iter_script_contents(body: bytes) -> Iterator[bytes]:
+    """
+    Yield the raw contents of every <script> tag in a page body.
+    
+    Regex scan over the response bytes - avoids building a DOM (and a
+    NavigableString per script) when only the embedded JSON is needed.
+    """
+    for match in _SCRIPT_RE.finditer(body):
+        yield match.group(1)
+
+
+def extract_title(body: bytes) -> str:
+    """
+    Get the text of a page's <title> from its raw bytes.
+    
+    Same result as soup.find('title').get_text() for the block checks,
+    without parsing the page into a DOM first.
+    """
+    match = _TITLE_RE.search(body)
+    if not match:
+        return ''
+    return html.unescape(match.group(1).decode('utf-8', errors='replace'))
+
+
+def extract_next_data(body: bytes) -> Optional[Dict]:
+    """
+    Extract pageProps from a Next.js page's raw bytes.
+    
+    Byte-level fast path for extract_json_from_script: skips building a
+    BeautifulSoup tree when only the embedded JSON is needed.
+    
+    Args:
+        body: Raw response bytes
+        
+    Returns:
+        pageProps dict, or None if __NEXT_DATA__ is missing or invalid
+    """
+    raw = fast_extract_next_data(body)
+    if not raw:
+        return None
+    try:
+        data = loads_json(raw)
+        return data.get('props', {}).get('pageProps', {})
+    except (json.JSONDecodeError, AttributeError) as e:
+        logger.warning(f"Failed to parse __NEXT_DATA__: {e}")
+        return None
+
+
+def _cached_per_soup(func):
+    """
+    Memoize a soup extraction helper on the soup object itself.
+    
+    Lets several parse paths ask for the same embedded data without
+    re-scanning the document; the cache goes away with the soup.
+    """
+    @functools.wraps(func)
+    def wrapper(soup, *args, **kwargs):
+        # Attribute lookups on a Tag fall through to find() for unknown
+        # names, so the cache lives in __dict__ directly
+        cache = soup.__dict__.setdefault('_extraction_cache', {})
+        key = (func.__name__, args, tuple(sorted(kwargs.items())))
+        if key not in cache:
+            cache[key] = func(soup, *args, **kwargs)
+        return cache[key]
+    return wrapper
+
+
+@_cached_per_soup
+def extract_json_from_script(soup: BeautifulSoup, pattern: str = None) -> Optional[Dict]:
+    """
+    Extract JSON data from script tags in Zillow pages.
+    
+    Zillow often embeds JSON data in script tags with specific IDs or patterns.
+    
+    Args:
+        soup: BeautifulSoup object
+        pattern: Optional regex pattern to match script content
+        
+    Returns:
+        Parsed JSON data or None
+    """
+    # Try to find __NEXT_DATA__ script (common in Next.js pages)
+    next_data = soup.find('script', {'id': '__NEXT_DATA__'})
+    if next_data:
+        try:
+            data = loads_json(next_data.string)
+            return data.get('props', {}).get('pageProps', {})
+        except (json.JSONDecodeError, AttributeError) as e:
+            logger.warning(f"Failed to parse __NEXT_DATA__: {e}")
+    
+    # One tree walk for both remaining lookups (the find above stops at its match)
+    scripts = soup.find_all('script')
+    
+    # Try to find application/json script
+    for script in scripts:
+        if script.get('type') != 'application/json':
+            continue
+        try:
+            if script.string:
+                return loads_json(script.string)
+        except json.JSONDecodeError:
+            continue
+    
+    # Try to find embedded JS data
+    if pattern:
+        for script in scripts:
+            if script.string and re.search(pattern, script.string):
+                match = _EMBEDDED_OBJECT_RE.search(script.string)
+                if match:
+                    try:
+                        return loads_json(match.group(1))
+                    except json.JSONDecodeError:
+                        continue
+    
+    return None
+
+
+def extract_apollo_state_from_bytes(body: bytes) -> Optional[Dict]:
+    """
+    Extract Apollo state data from a page's raw bytes.
+    
+    Zillow uses the Apollo GraphQL client and stores its state in a
+    script tag. Scripts are searched straight from the response body, so
+    no BeautifulSoup tree is needed.
+    """
+    for script in iter_script_contents(body):
+        if b'apolloState' not in script:
+            continue
+        match = _APOLLO_STATE_BYTES_RE.search(script)
+        if match:
+            try:
+                return loads_json(match.group(1))
+            except json.JSONDecodeError:
+                continue
+    return None
+
+
+def clean_price(price_str: str) -> Optional[float]:
+    """
+    Clean and parse a price string.
+    
+    Args:
+        price_str: Price string like "$1,234,567" or "1234567"
+        
+    Returns:
+        Float value or None if parsing fails
+    """
+    if not price_str:
+        return None
+    return _parse_price(str(price_str))
+
+
+@functools.lru_cache(maxsize=8192)
+def _parse_price(text: str) -> Optional[float]:
+    """clean_price body, memoized - the same price strings recur across pages."""
+    try:
+        # Remove currency symbols, commas, and whitespace
+        cleaned = _NON_PRICE_RE.sub('', text)
+        return float(cleaned) if cleaned else None
+    except ValueError:
+        return None
+
+
+def clean_number(num_str: str) -> Optional[int]:
+    """
+    Clean and parse a number string.
+    
+    Args:
+        num_str: Number string like "3 beds" or "2,500 sqft"
+        
+    Returns:
+        Integer value or None if parsing fails
+    """
+    if not num_str:
+        return None
+    return _parse_number(str(num_str))
+
+
+@functools.lru_cache(maxsize=8192)
+def _parse_number(text: str) -> Optional[int]:
+    """clean_number body, memoized like _parse_price."""
+    try:
+        # Extract first number from string
+        match = _NUMBER_RE.search(text)
+        if match:
+            cleaned = match.group().replace(',', '')
+            return int(cleaned)
+        return None
+    except ValueError:
+        return None
+
+
+def clean_text(text: str) -> str:
+    """Clean whitespace and normalize text, stripping HTML tags."""
+    if not text:
+        return ""
+    text = str(text)
+    # Strip HTML tags and decode entities - only when there's markup to strip
+    if '<' in text:
+        text = _TAG_RE.sub('', text)
+    if '&' in text:
+        text = html.unescape(text)
+    return ' '.join(text.split())
+
+
+def element_text(elem) -> str:
+    """
+    Whitespace-normalized text of an already-parsed element.
+    
+    Unlike clean_text this doesn't re-parse the text as HTML, and text
+    nodes are joined with a space so adjacent inline elements don't run
+    together.
+    """
+    if elem is None:
+        return ""
+    # Single text node (the usual card label) - skip get_text's descendant walk.
+    # Exact type check: Comment etc. subclass NavigableString but get_text skips them
+    string = elem.string
+    if type(string) is NavigableString:
+        return ' '.join(string.split())
+    return ' '.join(elem.get_text(' ', strip=True).split())
+
+
+def extract_zpid_from_url(url: str) -> Optional[int]:
+    """
+    Extract Zillow Property ID (zpid) from a URL.
+    
+    Args:
+        url: Zillow property URL
+        
+    Returns:
+        ZPID as integer or None
+    """
+    if not url:
+        return None
+    return _zpid_from_url(url)
+
+
+@functools.lru_cache(maxsize=8192)
+def _zpid_from_url(url: str) -> Optional[int]:
+    """extract_zpid_from_url body, memoized - listings repeat across searches."""
+    # Pattern: /homedetails/ADDRESS/ZPID_zpid/
+    match = _ZPID_PATH_RE.search(url)
+    if match:
+        return int(match.group(1))
+    
+    # Pattern: zpid=ZPID
+    match = _ZPID_QUERY_RE.search(url)
+    if match:
+        return int(match.group(1))
+    
+    return None
+
+
+# Alternate field names for the same card value across Zillow's list types
+# (search results, forSaleListings, pastSales), in lookup order
+_CARD_ADDRESS_KEYS = ('address', 'streetAddress')
+_CARD_URL_KEYS = ('detailUrl', 'listing_url', 'home_details_url')
+_CARD_PHOTO_KEYS = ('primary_photo_url', 'imgSrc', 'image_url', 'medium_image_url')
+_CARD_SQFT_KEYS = ('area', 'livingArea', 'livingAreaValue')
+_CARD_STATUS_KEYS = ('statusType', 'status', 'home_marketing_status', 'sold_date')
+_CARD_BROKERAGE_KEYS = ('brokerage_name', 'brokerName', 'brokerageName', 'listingProvider')
+_ATTRIBUTION_BROKERAGE_KEYS = ('brokerName', 'agentName', 'listingOffice')
+_CARD_PRICE_KEYS = ('price', 'unformattedPrice')
+_CARD_BEDS_KEYS = ('beds', 'bedrooms')
+_CARD_BATHS_KEYS = ('baths', 'bathrooms')
+_CARD_PROPERTY_TYPE_KEYS = ('propertyType', 'home_type')
+
+
+def _first_value(data: Dict, keys: Tuple[str, ...], default: Any = None) -> Any:
+    """
+    First truthy value among `keys`.
+    
+    Same result as `data.get(k1) or ... or data.get(kN, default)`: when
+    nothing is truthy, the last key's value (or `default`) is returned.
+    """
+    for key in keys:
+        value = data.get(key)
+        if value:
+            return value
+    return data.get(keys[-1], default)
+
+
+def parse_property_card(card_data: Dict) -> Optional[PropertyCard]:
+    """
+    Parse property data from a Zillow listing card.
+    
+    Args:
+        card_data: Dictionary containing property card data
+        
+    Returns:
+        Normalized PropertyCard record
+    """
+    try:
+        # Handle address - can be dict, string, or composed from street + city
+        address = _first_value(card_data, _CARD_ADDRESS_KEYS, '')
+        if isinstance(address, dict):
+            # Format address from dict (forSaleListings format)
+            line1 = address.get('line1', '')
+            line2 = address.get('line2', '')
+            address = f"{line1}, {line2}" if line1 and line2 else line1 or line2
+        elif not address:
+            # pastSales format: street_address + city_state_zipcode
+            street = card_data.get('street_address', '')
+            city_state = card_data.get('city_state_zipcode', '')
+            address = f"{street}, {city_state}" if street and city_state else street or city_state
+        
+        # Handle URL - may be relative or full, check multiple field names
+        url = _first_value(card_data, _CARD_URL_KEYS, '')
+        if url and not url.startswith('http'):
+            url = f"https://www.zillow.com{url}"
+        
+        # Handle photo URL - multiple possible field names
+        photo_url = _first_value(card_data, _CARD_PHOTO_KEYS, '')
+        
+        # Handle sqft - multiple possible field names
+        sqft = _first_value(card_data, _CARD_SQFT_KEYS)
+        
+        # Handle status - for sold properties, use sold_date
+        status = _first_value(card_data, _CARD_STATUS_KEYS, '')
+        
+        # Handle brokerage - multiple possible field names and nested structures
+        brokerage = _first_value(card_data, _CARD_BROKERAGE_KEYS) or ''
+        
+        # Check nested attributionInfo
+        if not brokerage:
+            attribution = card_data.get('attributionInfo', {})
+            if isinstance(attribution, dict):
+                brokerage = _first_value(attribution, _ATTRIBUTION_BROKERAGE_KEYS, '')
+        
+        return PropertyCard(
+            zpid=card_data.get('zpid') or extract_zpid_from_url(url),
+            address=address,
+            url=url,
+            photo_url=photo_url,
+            price=clean_price(_first_value(card_data, _CARD_PRICE_KEYS)),
+            beds=_first_value(card_data, _CARD_BEDS_KEYS),
+            baths=_first_value(card_data, _CARD_BATHS_KEYS),
+            sqft=sqft,
+            property_type=_first_value(card_data, _CARD_PROPERTY_TYPE_KEYS, ''),
+            status=status,
+            latitude=card_data.get('latitude'),
+            longitude=card_data.get('longitude'),
+            brokerage=brokerage,
+        )
+    except Exception as e:
+        logger.warning(f"Failed to parse property card: {e}")
+        return None
+
+
+def parse_agent_card(card_data: Dict) -> Optional[Dict]:
+    """
+    Parse agent data from a Zillow agent card.
+    
+    Args:
+        card_data: Dictionary containing agent card data
+        
+    Returns:
+        Normalized agent dictionary
+    """
+    try:
+        name = card_data.get('fullName') or card_data.get('name', '')
+        screenname = card_data.get('screenName', '')
+        
+        return {
+            'name': name,
+            'url': f"https://www.zillow.com/profile/{screenname}" if screenname else '',
+            'location': card_data.get('location', ''),
+            'phone': card_data.get('phone', ''),
+            'rating': card_data.get('avgRating'),
+            'reviews_count': card_data.get('numReviews'),
+            'sales_count': card_data.get('salesLast12Months'),
+            'photo_url': card_data.get('profilePhotoSrc', ''),
+        }
+    except Exception as e:
+        logger.warning(f"Failed to parse agent card: {e}")
+        return None
+
+
+# Alternate review field names (profile page vs reviews API), in lookup order
+_REVIEW_NAME_KEYS = ('reviewerName', 'subHeader')
+_REVIEW_RATING_KEYS = ('rating', 'overallRating')
+_REVIEW_TEXT_KEYS = ('reviewText', 'reviewComment')
+_REVIEW_DATE_KEYS = ('createDate', 'date')
+_REVIEW_TRANSACTION_KEYS = ('transactionType', 'workType', 'workDescription')
+
+
+def parse_review(review_data: Dict) -> Optional[Review]:
+    """
+    Parse review data from Zillow.
+    
+    Args:
+        review_data: Dictionary containing review data
+        
+    Returns:
+        Normalized Review record
+    """
+    try:
+        # Extract reviewer info which might be nested
+        reviewer = review_data.get('reviewer') or {}
+        reviewer_name = _first_value(review_data, _REVIEW_NAME_KEYS) or reviewer.get('screenName', '')
+        reviewer_zuid = review_data.get('reviewerZuid') or reviewer.get('encodedZuid', '')
+        
+        return Review(
+            zuid=reviewer_zuid,
+            rating=_first_value(review_data, _REVIEW_RATING_KEYS, 0),
+            review=clean_text(_first_value(review_data, _REVIEW_TEXT_KEYS, '')),
+            reviewer_name=reviewer_name,
+            date=_first_value(review_data, _REVIEW_DATE_KEYS, ''),
+            transaction_type=_first_value(review_data, _REVIEW_TRANSACTION_KEYS, ''),
+        )
+    except Exception as e:
+        logger.warning(f"Failed to parse review: {e}")
+        return None
+
+
+# Search URL path segment per list type (for-sale has none)
+_LIST_TYPE_PATHS = {'for-rent': 'rentals/', 'sold': 'sold/'}
+
+
+def build_search_url(
+    location: str = None,
+    list_type: str = 'for-sale',
+    page: int = 1,
+    **filters
+) -> str:
+    """
+    Build a Zillow search URL with filters.
+    
+    Args:
+        location: Location string (e.g., "seattle-wa")
+        list_type: Type of listing (for-sale, for-rent, sold)
+        page: Page number
+        **filters: Additional filters
+        
+    Returns:
+        Formatted search URL
+    """
+    location_path = f"/{location}/" if location else "/homes/"
+    list_type_path = _LIST_TYPE_PATHS.get(list_type, '')
+    # Add pagination
+    page_path = f"{page}_p/" if page > 1 else ''
+    
+    return f"https://www.zillow.com{location_path}{list_type_path}{page_path}"
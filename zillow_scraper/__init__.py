@@ -1,3 +1,3 @@
-"""
-Zillow Scraper - Django project package.
-"""
+"""
+Zillow Scraper - Django project package.
+"""
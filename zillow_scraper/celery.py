@@ -1,23 +1,23 @@
-"""
-Celery configuration for zillow_scraper project.
-"""
-
-import os
-from celery import Celery
-
-# Set the default Django settings module
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'zillow_scraper.settings')
-
-app = Celery('zillow_scraper')
-
-# Load config from Django settings, using CELERY_ namespace
-app.config_from_object('django.conf:settings', namespace='CELERY')
-
-# Auto-discover tasks in all installed apps
-app.autodiscover_tasks()
-
-
-@app.task(bind=True, ignore_result=True)
-def debug_task(self):
-    """Debug task to verify Celery is working."""
-    print(f'Request: {self.request!r}')
+"""
+Celery configuration for zillow_scraper project.
+"""
+
+import os
+from celery import Celery
+
+# Set the default Django settings module
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'zillow_scraper.settings')
+
+app = Celery('zillow_scraper')
+
+# Load config from Django settings, using CELERY_ namespace
+app.config_from_object('django.conf:settings', namespace='CELERY')
+
+# Only the api app defines tasks - don't import every installed app at worker boot
+app.autodiscover_tasks(['api'])
+
+
+@app.task(bind=True, ignore_result=True)
+def debug_task(self):
+    """Debug task to verify Celery is working."""
+    print(f'Request: {self.request!r}')